@@ -1,34 +1,67 @@
 import logging
+import os
 import socket
 import time
 import uuid
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 import psutil
 
 
-def _read_thermal_zones() -> Dict[str, float]:
-    zones = {}
-    base = Path("/sys/devices/virtual/thermal")
-    if not base.exists():
-        return zones
+_THERMAL_BASE = Path("/sys/devices/virtual/thermal")
+_ZONE_REFRESH_SECONDS = 300.0
+_ZONE_CACHE: Optional[List[Tuple[str, int]]] = None
+_ZONE_CACHE_EXPIRES = 0.0
+
 
-    for zone in base.glob("thermal_zone*"):
+def _discover_thermal_zones() -> List[Tuple[str, int]]:
+    discovered = []
+    if not _THERMAL_BASE.exists():
+        return discovered
+
+    for zone in _THERMAL_BASE.glob("thermal_zone*"):
         type_file = zone / "type"
         temp_file = zone / "temp"
         if not type_file.exists() or not temp_file.exists():
             continue
+        zone_type = _safe_read_text(type_file)
+        if not zone_type:
+            continue
         try:
-            zone_type = _safe_read_text(type_file)
-            temp_raw = _safe_read_text(temp_file)
-            if not zone_type or not temp_raw:
-                continue
-            temp_c = float(temp_raw) / 1000.0
-            zones[zone_type] = temp_c
-        except (OSError, ValueError, TypeError) as exc:
-            logging.debug("Failed reading thermal zone %s: %s", zone, exc)
+            fd = os.open(temp_file, os.O_RDONLY)
+        except OSError as exc:
+            logging.debug("Failed opening thermal zone %s: %s", zone, exc)
             continue
+        discovered.append((zone_type, fd))
+    return discovered
+
+
+def _close_thermal_zones(cache: List[Tuple[str, int]]) -> None:
+    for _, fd in cache:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+def _read_thermal_zones() -> Dict[str, float]:
+    global _ZONE_CACHE, _ZONE_CACHE_EXPIRES
+    now = time.monotonic()
+    if _ZONE_CACHE is None or now >= _ZONE_CACHE_EXPIRES:
+        if _ZONE_CACHE:
+            _close_thermal_zones(_ZONE_CACHE)
+        _ZONE_CACHE = _discover_thermal_zones()
+        _ZONE_CACHE_EXPIRES = now + _ZONE_REFRESH_SECONDS
+
+    zones = {}
+    for zone_type, fd in _ZONE_CACHE:
+        try:
+            zones[zone_type] = int(os.pread(fd, 16, 0)) / 1000.0
+        except OSError as exc:
+            logging.debug("Failed reading thermal zone %s: %s", zone_type, exc)
+        except ValueError as exc:
+            logging.debug("Failed parsing thermal zone %s: %s", zone_type, exc)
     return zones
 
 
@@ -41,6 +74,10 @@ def _cpu_temp_from_zones(zones: Dict[str, float]) -> Optional[float]:
     return max(zones.values())
 
 
+def prime_cpu_sampler() -> None:
+    psutil.cpu_percent(interval=None)
+
+
 def collect_metrics() -> Dict[str, object]:
     host = socket.gethostname()
     ip_address, mac_address = _get_primary_network_info()
@@ -48,7 +85,6 @@ def collect_metrics() -> Dict[str, object]:
     zones = _read_thermal_zones()
 
     return {
-        "row_id": str(uuid.uuid4()),
         "host": host,
         "ip_address": ip_address,
         "mac_address": mac_address,
@@ -58,7 +94,7 @@ def collect_metrics() -> Dict[str, object]:
         "cpu_usage_pct": psutil.cpu_percent(interval=None),
         "mem_usage_pct": psutil.virtual_memory().percent,
         "disk_usage_pct": psutil.disk_usage("/").percent,
-        "thermal_zones": zones,
+        "thermal_zones_c100": {name: int(round(temp_c * 100)) for name, temp_c in zones.items()},
     }
 
 
@@ -73,24 +109,44 @@ def _safe_read_text(path: Path) -> str:
             return ""
 
 
+_NET_CACHE_TTL_SECONDS = 60.0
+_NET_CACHE: Dict[str, object] = {"exp": 0.0, "val": ("unknown", "unknown")}
+
+
 def _get_primary_network_info() -> tuple[str, str]:
+    if time.monotonic() < _NET_CACHE["exp"]:
+        return _NET_CACHE["val"]
+
+    result = _resolve_primary_network_info()
+    _NET_CACHE["val"] = result
+    _NET_CACHE["exp"] = time.monotonic() + _NET_CACHE_TTL_SECONDS
+    return result
+
+
+def _resolve_primary_network_info() -> tuple[str, str]:
     stats = psutil.net_if_stats()
-    addrs_map = psutil.net_if_addrs()
+    mac_only = None
 
-    for iface, iface_stats in stats.items():
-        if not iface_stats.isup or iface.startswith("lo"):
+    for iface, addr_list in psutil.net_if_addrs().items():
+        iface_stats = stats.get(iface)
+        if iface_stats is None or not iface_stats.isup or iface.startswith("lo"):
             continue
         ip = None
         mac = None
-        for addr in addrs_map.get(iface, []):
+        for addr in addr_list:
             if addr.family == socket.AF_INET:
                 if addr.address and not addr.address.startswith("127.") and not addr.address.startswith("169.254."):
                     ip = addr.address
             elif addr.family == psutil.AF_LINK:
                 if addr.address and addr.address != "00:00:00:00:00:00":
                     mac = addr.address
-        if ip or mac:
-            return ip or "unknown", mac or "unknown"
+        if ip:
+            return ip, mac or "unknown"
+        if mac and mac_only is None:
+            mac_only = mac
+
+    if mac_only:
+        return "unknown", mac_only
 
     try:
         fallback_ip = socket.gethostbyname(socket.gethostname())
@@ -1,11 +1,16 @@
 import argparse
 import json
 import logging
+import os
+import queue
+import threading
 import time
+import uuid
+from concurrent.futures import Future
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from jetson_metrics import collect_metrics
+from jetson_metrics import collect_metrics, prime_cpu_sampler
 from ollama_client import OllamaClient, OllamaConfig
 from slack_client import SlackClient, SlackConfig
 from snowpipe_streaming_client import SnowpipeConfig, SnowpipeStreamingClient
@@ -17,18 +22,27 @@ def _load_config(path: Path) -> dict:
         return json.load(handle)
 
 
-def _build_rows(
-    batch_size: int,
+def _submit_io(fn, *args) -> Future:
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="batch-io", daemon=True).start()
+    return future
+
+
+def _capture_and_analyze(
     ollama: Optional[OllamaClient],
     video_cfg: Optional[VideoCaptureConfig],
     slack: Optional[SlackClient],
     image_prompt: Optional[str],
-) -> List[dict]:
-    rows = []
-    sample_metrics = collect_metrics()
-    summary = ollama.summarize(sample_metrics) if ollama else None
-    if ollama and not summary:
-        logging.warning("EDGE_AI_SUMMARY is empty; check Ollama config/model.")
+) -> Tuple[Optional[str], bool, Optional[str]]:
     image_path, image_captured = capture_frame(video_cfg) if video_cfg else (None, False)
     if video_cfg and video_cfg.enabled and not image_captured:
         logging.warning("Video capture enabled but no image was captured.")
@@ -42,26 +56,46 @@ def _build_rows(
     if image_captured and image_path and slack:
         slack.send_image(image_path, image_summary)
 
-    for _ in range(batch_size):
-        metrics = collect_metrics()
-        row = {
-            "row_id": metrics["row_id"],
-            "host": metrics["host"],
-            "ip_address": metrics["ip_address"],
-            "mac_address": metrics["mac_address"],
-            "ts_utc": metrics["ts_utc"],
-            "ts_epoch_ms": metrics["ts_epoch_ms"],
-            "cpu_temp_c": metrics["cpu_temp_c"],
-            "cpu_usage_pct": metrics["cpu_usage_pct"],
-            "mem_usage_pct": metrics["mem_usage_pct"],
-            "disk_usage_pct": metrics["disk_usage_pct"],
-            "thermal_zones": metrics["thermal_zones"],
-            "edge_ai_summary": summary,
-            "image_path": image_path,
-            "image_captured": image_captured,
-            "image_ai_summary": image_summary,
-            "payload": metrics,
-        }
+    return image_path, image_captured, image_summary
+
+
+def _row_ids(count: int) -> List[str]:
+    count = max(count, 0)
+    raw = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=raw[i : i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def _build_rows(
+    batch_size: int,
+    ollama: Optional[OllamaClient],
+    video_cfg: Optional[VideoCaptureConfig],
+    slack: Optional[SlackClient],
+    image_prompt: Optional[str],
+) -> List[dict]:
+    rows = []
+    sample_metrics = collect_metrics()
+    summary_future = _submit_io(ollama.summarize, sample_metrics) if ollama else None
+    image_future = _submit_io(_capture_and_analyze, ollama, video_cfg, slack, image_prompt)
+
+    summary = summary_future.result() if summary_future else None
+    if ollama and not summary:
+        logging.warning("EDGE_AI_SUMMARY is empty; check Ollama config/model.")
+    image_path, image_captured, image_summary = image_future.result()
+
+    base_row = {
+        "row_id": None,
+        **sample_metrics,
+        "edge_ai_summary": summary,
+        "image_path": image_path,
+        "image_captured": image_captured,
+        "image_ai_summary": image_summary,
+    }
+    for row_id in _row_ids(batch_size):
+        now = time.time()
+        row = dict(base_row)
+        row["row_id"] = row_id
+        row["ts_utc"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        row["ts_epoch_ms"] = int(now * 1000)
         rows.append(row)
     return rows
 
@@ -75,6 +109,33 @@ def _next_offset(current: Optional[str]) -> str:
         return str(int(time.time() * 1000))
 
 
+def _put_until_stopped(batches: "queue.Queue[object]", item: object, stop: threading.Event) -> None:
+    while not stop.is_set():
+        try:
+            batches.put(item, timeout=0.5)
+            return
+        except queue.Full:
+            continue
+
+
+def _produce_batches(
+    batches: "queue.Queue[object]",
+    stop: threading.Event,
+    args: argparse.Namespace,
+    ollama: Optional[OllamaClient],
+    video_cfg: Optional[VideoCaptureConfig],
+    slack: Optional[SlackClient],
+    image_prompt: Optional[str],
+) -> None:
+    try:
+        while not stop.is_set():
+            rows = _build_rows(args.batch_size, ollama, video_cfg, slack, image_prompt)
+            _put_until_stopped(batches, rows, stop)
+            stop.wait(args.interval)
+    except Exception as exc:
+        _put_until_stopped(batches, exc, stop)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Jetson Orin Snowpipe Streaming v2")
     parser.add_argument("--config", default="snowflake_config.json", help="Path to config file")
@@ -130,6 +191,8 @@ def main() -> None:
             device_index=int(video_cfg.get("device_index", 0)),
             output_dir=video_cfg.get("output_dir", "./captures"),
             filename_prefix=video_cfg.get("filename_prefix", "orin"),
+            jpeg_quality=int(video_cfg.get("jpeg_quality", 85)),
+            gstreamer_pipeline=video_cfg.get("gstreamer_pipeline") or None,
         )
 
     slack_cfg = config_data.get("slack", {})
@@ -175,34 +238,52 @@ def main() -> None:
         jwt_lifetime_seconds=int(config_data.get("jwt_lifetime_seconds", 3600)),
         pat_token=pat_token or None,
         control_host=control_host,
+        gzip_rows=bool(config_data.get("gzip_rows", False)),
+        gzip_level=int(config_data.get("gzip_level", 3)),
     )
 
+    prime_cpu_sampler()
+
     client = SnowpipeStreamingClient(snowpipe_cfg)
     logging.info("Connecting to Snowpipe Streaming...")
     client.connect()
     logging.info("Connected. ingest_host=%s", client.ingest_host)
 
-    batch_number = 0
-    while True:
-        batch_number += 1
-        rows = _build_rows(args.batch_size, ollama, video_capture, slack_client, image_prompt)
-        logging.debug("Built %s rows for batch %s", len(rows), batch_number)
-        offset_token = _next_offset(client.offset_token)
-        logging.debug("Appending rows with offset_token=%s", offset_token)
-        response = client.append_rows(rows, offset_token=offset_token)
-        client.offset_token = offset_token
-
-        print(
-            f"[OK] Batch {batch_number} sent: rows={len(rows)} "
-            f"offset={offset_token} next_token={response.get('next_continuation_token')}"
-        )
+    batches: "queue.Queue[object]" = queue.Queue(maxsize=2)
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_produce_batches,
+        args=(batches, stop, args, ollama, video_capture, slack_client, image_prompt),
+        name="batch-producer",
+        daemon=True,
+    )
+    producer.start()
 
-        if args.verify_commit:
-            committed = client.wait_for_commit(offset_token)
-            status = "committed" if committed else "pending"
-            print(f"[INFO] Batch {batch_number} commit status: {status}")
+    try:
+        batch_number = 0
+        while True:
+            item = batches.get()
+            if isinstance(item, BaseException):
+                raise item
+            rows = item
+            batch_number += 1
+            logging.debug("Built %s rows for batch %s", len(rows), batch_number)
+            offset_token = _next_offset(client.offset_token)
+            logging.debug("Appending rows with offset_token=%s", offset_token)
+            response = client.append_rows(rows, offset_token=offset_token)
+            client.offset_token = offset_token
+
+            print(
+                f"[OK] Batch {batch_number} sent: rows={len(rows)} "
+                f"offset={offset_token} next_token={response.get('next_continuation_token')}"
+            )
 
-        time.sleep(args.interval)
+            if args.verify_commit:
+                committed = client.wait_for_commit(offset_token)
+                status = "committed" if committed else "pending"
+                print(f"[INFO] Batch {batch_number} commit status: {status}")
+    finally:
+        stop.set()
 
 
 if __name__ == "__main__":
@@ -1,12 +1,20 @@
 import base64
 import json
 import logging
+import mmap
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Optional
 
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_PROMPT_EXCLUDED_KEYS = frozenset({"thermal_zones_c100"})
+
 
 @dataclass
 class OllamaConfig:
@@ -25,7 +33,7 @@ class OllamaClient:
         if not self.config.enabled:
             return None
 
-        prompt = self.config.prompt_template.format(metrics=json.dumps(metrics, sort_keys=True))
+        prompt = self.config.prompt_template.format(metrics=_metrics_for_prompt(metrics))
         payload = {
             "model": self.config.model,
             "prompt": prompt,
@@ -77,9 +85,17 @@ class OllamaClient:
             return None
 
 
+def _metrics_for_prompt(metrics: dict) -> str:
+    subset = {key: value for key, value in metrics.items() if key not in _PROMPT_EXCLUDED_KEYS}
+    if orjson is not None:
+        return orjson.dumps(subset, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    return json.dumps(subset, sort_keys=True)
+
+
 def _read_image_base64(path: str) -> Optional[str]:
     try:
-        data = Path(path).read_bytes()
-        return base64.b64encode(data).decode("utf-8")
+        with open(path, "rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return base64.b64encode(mapped).decode("ascii")
     except Exception:
         return None
@@ -15,13 +15,16 @@ CREATE OR REPLACE TABLE DEMO.DEMO.JETSON_EDGE_STREAM (
   cpu_usage_pct NUMBER(10, 3),
   mem_usage_pct NUMBER(10, 3),
   disk_usage_pct NUMBER(10, 3),
-  thermal_zones VARIANT,
+  thermal_zones_c100 VARIANT,
   edge_ai_summary STRING,
   image_path STRING,
   image_captured BOOLEAN,
-  image_ai_summary STRING,
-  payload VARIANT
+  image_ai_summary STRING
 );
 
+-- Existing tables created before thermal_zones_c100 (zone temps in
+-- hundredths of a degree C) can be migrated with:
+-- ALTER TABLE DEMO.DEMO.JETSON_EDGE_STREAM ADD COLUMN thermal_zones_c100 VARIANT;
+
 -- The default streaming pipe for the table is created by Snowflake:
 -- JETSON_EDGE_STREAM-STREAMING
@@ -2,9 +2,6 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
-
 
 @dataclass
 class SlackConfig:
@@ -16,10 +13,14 @@ class SlackConfig:
 
 class SlackClient:
     def __init__(self, config: SlackConfig) -> None:
+        from slack_sdk import WebClient
+
         self.config = config
         self.client = WebClient(token=config.bot_token)
 
     def send_image(self, image_path: str, caption: Optional[str]) -> None:
+        from slack_sdk.errors import SlackApiError
+
         if not self.config.enabled:
             return
 
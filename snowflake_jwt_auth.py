@@ -1,12 +1,14 @@
+from __future__ import annotations
+
 import base64
 import hashlib
 import time
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-import jwt
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric import rsa
 
 
 @dataclass
@@ -20,6 +22,8 @@ class JwtConfig:
 
 
 def _load_private_key(path: str, passphrase: Optional[str]) -> rsa.RSAPrivateKey:
+    from cryptography.hazmat.primitives import serialization
+
     with open(path, "rb") as key_file:
         key_bytes = key_file.read()
     password = passphrase.encode("utf-8") if passphrase else None
@@ -27,6 +31,8 @@ def _load_private_key(path: str, passphrase: Optional[str]) -> rsa.RSAPrivateKey
 
 
 def _public_key_fingerprint(private_key: rsa.RSAPrivateKey) -> str:
+    from cryptography.hazmat.primitives import serialization
+
     public_key = private_key.public_key()
     der_bytes = public_key.public_bytes(
         encoding=serialization.Encoding.DER,
@@ -37,18 +43,55 @@ def _public_key_fingerprint(private_key: rsa.RSAPrivateKey) -> str:
     return f"SHA256:{fp}"
 
 
+def _cached_public_key_fingerprint(key_path: str, private_key: rsa.RSAPrivateKey) -> str:
+    fp_path = Path(f"{key_path}.fp")
+    try:
+        key_stat = Path(key_path).stat()
+        key_stamp = f"{key_stat.st_mtime_ns} {key_stat.st_size}"
+    except OSError:
+        key_stamp = None
+
+    if key_stamp is not None:
+        try:
+            stamp, cached = fp_path.read_text(encoding="utf-8").splitlines()[:2]
+            if stamp == key_stamp and cached.startswith("SHA256:"):
+                return cached
+        except (OSError, ValueError):
+            pass
+
+    fp = _public_key_fingerprint(private_key)
+    if key_stamp is not None:
+        try:
+            fp_path.write_text(f"{key_stamp}\n{fp}\n", encoding="utf-8")
+        except OSError:
+            pass
+    return fp
+
+
 def _normalize_identifier(value: str) -> str:
     return value.upper()
 
 
-def generate_jwt(config: JwtConfig) -> str:
+def load_signing_key(config: JwtConfig) -> tuple[rsa.RSAPrivateKey, str]:
     private_key = _load_private_key(config.private_key_path, config.private_key_passphrase)
-    public_key_fp = config.public_key_fp or _public_key_fingerprint(private_key)
+    public_key_fp = config.public_key_fp or _cached_public_key_fingerprint(
+        config.private_key_path, private_key
+    )
+    return private_key, public_key_fp
+
+
+def sign_jwt(
+    config: JwtConfig,
+    private_key: rsa.RSAPrivateKey,
+    public_key_fp: str,
+    issued_at: Optional[int] = None,
+) -> str:
+    import jwt
 
     account = _normalize_identifier(config.account_identifier)
     user = _normalize_identifier(config.user)
 
-    now = int(time.time())
+    now = int(time.time()) if issued_at is None else issued_at
     payload = {
         "iss": f"{account}.{user}.{public_key_fp}",
         "sub": f"{account}.{user}",
@@ -56,3 +99,8 @@ def generate_jwt(config: JwtConfig) -> str:
         "exp": now + config.lifetime_seconds,
     }
     return jwt.encode(payload, private_key, algorithm="RS256")
+
+
+def generate_jwt(config: JwtConfig) -> str:
+    private_key, public_key_fp = load_signing_key(config)
+    return sign_jwt(config, private_key, public_key_fp)
@@ -1,3 +1,4 @@
+import gzip
 import json
 import time
 import uuid
@@ -5,8 +6,18 @@ from dataclasses import dataclass
 from typing import Iterable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from snowflake_jwt_auth import JwtConfig, generate_jwt
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from snowflake_jwt_auth import JwtConfig, load_signing_key, sign_jwt
+
+
+_JWT_REFRESH_MARGIN_SECONDS = 60
 
 
 @dataclass
@@ -26,6 +37,8 @@ class SnowpipeConfig:
     jwt_lifetime_seconds: int
     pat_token: Optional[str]
     control_host: Optional[str] = None
+    gzip_rows: bool = False
+    gzip_level: int = 3
 
 
 class SnowpipeStreamingClient:
@@ -41,6 +54,10 @@ class SnowpipeStreamingClient:
         self.scoped_token_type = None
         self.continuation_token = None
         self.offset_token = None
+        self.session = _build_session()
+        self._signing_key = None
+        self._jwt_cache = None
+        self._ndjson_buf = bytearray()
 
     def _headers(self, token: str, token_type: str) -> dict:
         headers = {
@@ -53,8 +70,8 @@ class SnowpipeStreamingClient:
     def _request_id(self) -> str:
         return str(uuid.uuid4())
 
-    def _jwt_token(self) -> str:
-        jwt_config = JwtConfig(
+    def _jwt_config(self) -> JwtConfig:
+        return JwtConfig(
             account_identifier=self.config.account_identifier,
             user=self.config.user,
             private_key_path=self.config.private_key_path,
@@ -62,7 +79,21 @@ class SnowpipeStreamingClient:
             public_key_fp=self.config.public_key_fp or None,
             lifetime_seconds=self.config.jwt_lifetime_seconds,
         )
-        return generate_jwt(jwt_config)
+
+    def _jwt_token(self) -> str:
+        now = int(time.time())
+        if self._jwt_cache is not None:
+            token, expires_at = self._jwt_cache
+            if now < expires_at - _JWT_REFRESH_MARGIN_SECONDS:
+                return token
+
+        jwt_config = self._jwt_config()
+        if self._signing_key is None:
+            self._signing_key = load_signing_key(jwt_config)
+        private_key, public_key_fp = self._signing_key
+        token = sign_jwt(jwt_config, private_key, public_key_fp, issued_at=now)
+        self._jwt_cache = (token, now + jwt_config.lifetime_seconds)
+        return token
 
     def _auth_token(self) -> tuple[str, str]:
         auth_method = (self.config.auth_method or "").lower()
@@ -75,7 +106,7 @@ class SnowpipeStreamingClient:
     def get_ingest_host(self) -> str:
         token, token_type = self._auth_token()
         url = f"https://{self.control_host}/v2/streaming/hostname"
-        response = requests.get(url, headers=self._headers(token, token_type), timeout=30)
+        response = self.session.get(url, headers=self._headers(token, token_type), timeout=30)
         response.raise_for_status()
         host = None
         try:
@@ -110,7 +141,7 @@ class SnowpipeStreamingClient:
         }
         headers = self._headers(token, token_type)
         headers["Content-Type"] = "application/x-www-form-urlencoded"
-        response = requests.post(url, data=payload, headers=headers, timeout=30)
+        response = self.session.post(url, data=payload, headers=headers, timeout=30)
         response.raise_for_status()
         self.scoped_token = response.json()["token"]
         self.scoped_token_type = "OAUTH"
@@ -126,7 +157,7 @@ class SnowpipeStreamingClient:
         payload = {}
         if offset_token is not None:
             payload["offset_token"] = offset_token
-        response = requests.put(
+        response = self.session.put(
             url,
             headers=self._headers(self.scoped_token, self.scoped_token_type),
             json=payload,
@@ -143,7 +174,7 @@ class SnowpipeStreamingClient:
         if not self.ingest_host or not self.continuation_token:
             raise RuntimeError("channel not opened")
 
-        ndjson = "".join(json.dumps(row) + "\n" for row in rows)
+        ndjson = _encode_ndjson(rows, self._ndjson_buf)
         params = {"continuationToken": self.continuation_token}
         if offset_token is not None:
             params["offsetToken"] = offset_token
@@ -154,7 +185,12 @@ class SnowpipeStreamingClient:
         )
         headers = self._headers(self.scoped_token, self.scoped_token_type)
         headers["Content-Type"] = "application/x-ndjson"
-        response = requests.post(url, headers=headers, params=params, data=ndjson.encode("utf-8"), timeout=30)
+        if self.config.gzip_rows:
+            body = gzip.compress(ndjson, compresslevel=self.config.gzip_level)
+            headers["Content-Encoding"] = "gzip"
+        else:
+            body = bytes(ndjson)
+        response = self.session.post(url, headers=headers, params=params, data=body, timeout=30)
         response.raise_for_status()
         data = response.json()
         self.continuation_token = data["next_continuation_token"]
@@ -166,7 +202,7 @@ class SnowpipeStreamingClient:
             f"/schemas/{self.config.schema}/pipes/{self.config.pipe}:bulk-channel-status"
         )
         payload = {"channel_names": [self.config.channel_name]}
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self._headers(self.scoped_token, self.scoped_token_type),
             json=payload,
@@ -180,7 +216,7 @@ class SnowpipeStreamingClient:
             f"https://{self.ingest_host}/v2/streaming/databases/{self.config.database}"
             f"/schemas/{self.config.schema}/pipes/{self.config.pipe}/channels/{self.config.channel_name}"
         )
-        response = requests.delete(
+        response = self.session.delete(
             url,
             headers=self._headers(self.scoped_token, self.scoped_token_type),
             params={"requestId": self._request_id()},
@@ -197,12 +233,41 @@ class SnowpipeStreamingClient:
         if expected_offset is None:
             return True
 
-        start = time.time()
-        while time.time() - start < timeout_seconds:
+        deadline = time.monotonic() + timeout_seconds
+        delay = 0.2
+        while True:
             status = self.get_channel_status()
             channel = status.get("channel_statuses", {}).get(self.config.channel_name, {})
             committed = channel.get("last_committed_offset_token")
             if committed is not None and str(committed) >= str(expected_offset):
                 return True
-            time.sleep(1)
-        return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 5.0)
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+
+def _encode_ndjson(rows: Iterable[dict], buf: bytearray) -> bytearray:
+    buf.clear()
+    if orjson is not None:
+        for row in rows:
+            buf += orjson.dumps(row)
+            buf.append(0x0A)
+    else:
+        for row in rows:
+            buf += json.dumps(row).encode("utf-8")
+            buf.append(0x0A)
+    return buf
@@ -1,9 +1,11 @@
+import atexit
 import logging
+import threading
 import time
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 
 @dataclass
@@ -12,34 +14,172 @@ class VideoCaptureConfig:
     device_index: int
     output_dir: str
     filename_prefix: str = "orin"
+    jpeg_quality: int = 85
+    gstreamer_pipeline: Optional[str] = None
 
 
-def capture_frame(config: VideoCaptureConfig) -> Tuple[Optional[str], bool]:
-    if not config.enabled:
-        return None, False
+_MAX_GRAB_FAILURES = 100
 
-    try:
-        import cv2
-    except ImportError:
-        logging.warning("OpenCV not installed; video capture disabled.")
-        return None, False
 
-    output_dir = Path(config.output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    filename = f"{config.filename_prefix}{uuid.uuid4()}.jpg"
-    output_path = output_dir / filename
+class VideoCaptureWorker:
+    def __init__(self, config: VideoCaptureConfig) -> None:
+        self.config = config
+        self._cv2 = None
+        self._cam = None
+        self._lock: Optional[threading.Lock] = None
+        self._stop: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
 
-    cam = cv2.VideoCapture(config.device_index)
-    try:
+    def start(self) -> bool:
+        if self._cam is not None:
+            if self._thread is not None and self._thread.is_alive():
+                return True
+            self.release()
+
+        try:
+            import cv2
+        except ImportError:
+            logging.warning("OpenCV not installed; video capture disabled.")
+            return False
+
+        cam = self._open(cv2)
         if not cam.isOpened():
-            logging.warning("Video capture device %s not available.", config.device_index)
-            return None, False
-        ok, frame = cam.read()
+            cam.release()
+            logging.warning("Video capture device %s not available.", self._source_name())
+            return False
+
+        self._cv2 = cv2
+        self._cam = cam
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._grab_loop,
+            args=(cam, self._lock, self._stop),
+            name=f"video-grab-{self._source_name()}",
+            daemon=True,
+        )
+        self._thread.start()
+        return True
+
+    def _open(self, cv2):
+        if self.config.gstreamer_pipeline:
+            return cv2.VideoCapture(self.config.gstreamer_pipeline, cv2.CAP_GSTREAMER)
+        cam = cv2.VideoCapture(self.config.device_index, cv2.CAP_V4L2)
+        if not cam.isOpened():
+            cam.release()
+            cam = cv2.VideoCapture(self.config.device_index)
+        if cam.isOpened():
+            cam.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return cam
+
+    def _source_name(self) -> str:
+        return self.config.gstreamer_pipeline or str(self.config.device_index)
+
+    def _grab_loop(self, cam, lock: threading.Lock, stop: threading.Event) -> None:
+        failures = 0
+        try:
+            while not stop.is_set():
+                with lock:
+                    ok = cam.grab()
+                if ok:
+                    failures = 0
+                    time.sleep(0)
+                    continue
+                failures += 1
+                if failures >= _MAX_GRAB_FAILURES:
+                    logging.warning(
+                        "Video capture on device %s stopped after %s failed grabs.",
+                        self._source_name(),
+                        failures,
+                    )
+                    return
+                stop.wait(0.05)
+        finally:
+            with lock:
+                cam.release()
+
+    def read_frame(self):
+        if not self.start():
+            return None
+        cam, lock = self._cam, self._lock
+        with lock:
+            ok, frame = cam.retrieve()
+            if not ok:
+                ok, frame = cam.read()
         if not ok:
-            logging.warning("Video capture read failed on device %s.", config.device_index)
+            logging.warning("Video capture read failed on device %s.", self._source_name())
+            self.release()
+            return None
+        return frame
+
+    def capture(self) -> Tuple[Optional[str], bool]:
+        frame = self.read_frame()
+        if frame is None:
             return None, False
-        cv2.imwrite(str(output_path), frame)
-    finally:
-        cam.release()
 
-    return str(output_path), True
+        if _is_encoded_jpeg(frame):
+            encoded = frame
+        else:
+            cv2 = self._cv2
+            ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self.config.jpeg_quality])
+            if not ok:
+                logging.warning("JPEG encoding failed on device %s.", self._source_name())
+                return None, False
+
+        output_dir = Path(self.config.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / f"{self.config.filename_prefix}{uuid.uuid4()}.jpg"
+        output_path.write_bytes(encoded.tobytes())
+        return str(output_path), True
+
+    def release(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=1.0)
+            if thread.is_alive():
+                logging.warning("Video grab thread for device %s did not stop; abandoning it.", self._source_name())
+        self._thread = None
+        self._stop = None
+        self._lock = None
+        self._cam = None
+
+
+def _is_encoded_jpeg(frame) -> bool:
+    if frame.ndim > 2 or (frame.ndim == 2 and frame.shape[0] != 1):
+        return False
+    return frame.reshape(-1)[:2].tobytes() == b"\xff\xd8"
+
+
+_WORKERS: Dict[object, VideoCaptureWorker] = {}
+_WORKERS_LOCK = threading.Lock()
+
+
+def _get_worker(config: VideoCaptureConfig) -> VideoCaptureWorker:
+    with _WORKERS_LOCK:
+        key = config.gstreamer_pipeline or config.device_index
+        worker = _WORKERS.get(key)
+        if worker is None:
+            worker = VideoCaptureWorker(config)
+            _WORKERS[key] = worker
+        else:
+            worker.config = config
+        return worker
+
+
+def release_all() -> None:
+    with _WORKERS_LOCK:
+        workers = list(_WORKERS.values())
+        _WORKERS.clear()
+    for worker in workers:
+        worker.release()
+
+
+atexit.register(release_all)
+
+
+def capture_frame(config: VideoCaptureConfig) -> Tuple[Optional[str], bool]:
+    if not config.enabled:
+        return None, False
+    return _get_worker(config).capture()